@@ -13,13 +13,33 @@
 # limitations under the License.
 
 
+import copy
+import functools
 import json
-from yaml import dump, load, Dumper, Loader
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from yaml import dump, load
+
+try:
+    from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+except ImportError:
+    from yaml import SafeLoader as Loader, SafeDumper as Dumper
+
+# orjson is an optional, faster parser for configs which are pure JSON
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 from data_validation import cli_tools, consts
 from data_validation.config_manager import ConfigManager
 from data_validation.data_validation import DataValidation
 
+DEFAULT_MAX_THREADS = 8
+GROUPED_VALIDATION_TYPES = frozenset(("GroupedColumn", "Row"))
+ROW_VALIDATION_TYPES = frozenset(("Row",))
+
 
 def _get_arg_config_file(args):
     """Return String yaml config file path."""
@@ -29,12 +49,59 @@ def _get_arg_config_file(args):
     return args.config_file
 
 
+def _is_json_file(config_file):
+    """Return True if the first non-whitespace byte opens a JSON object or list.
+
+    The file is rewound to the start before returning.
+    """
+    first_byte = config_file.read(1)
+    while first_byte.isspace():
+        first_byte = config_file.read(1)
+    config_file.seek(0)
+
+    return first_byte in (b"{", b"[")
+
+
+@functools.lru_cache(maxsize=64)
+def _load_yaml_cached(config_file_path, mtime_ns, size):
+    """Return Dict of parsed yaml data, cached by file path, mtime and size.
+
+    The mtime and size are only used as part of the cache key so that
+    an edited file is parsed again. Cache hits and misses are available
+    via `_load_yaml_cached.cache_info()`.
+    """
+    with open(config_file_path, "rb") as yaml_file:
+        if _is_json_file(yaml_file):
+            try:
+                return json_loads(yaml_file.read())
+            except ValueError:
+                # YAML flow style (ie. "{a: b}") is not valid JSON
+                yaml_file.seek(0)
+        yaml_configs = load(yaml_file, Loader=Loader)
+
+    return yaml_configs
+
+
 def _get_yaml_config_from_file(config_file_path):
     """Return Dict of yaml validation data."""
-    with open(config_file_path, "r") as yaml_file:
-        yaml_configs = load(yaml_file.read(), Loader=Loader)
+    file_stat = os.stat(config_file_path)
+    yaml_configs = _load_yaml_cached(
+        config_file_path, file_stat.st_mtime_ns, file_stat.st_size
+    )
+
+    # Callers update the validation dicts in place, copy to protect the cache.
+    return copy.deepcopy(yaml_configs)
 
-    return yaml_configs
+
+@functools.lru_cache(maxsize=32)
+def _get_data_client_cached(conn_key):
+    """Return DataClient for a JSON encoded connection, reusing prior clients."""
+    return DataValidation.get_data_client(json.loads(conn_key))
+
+
+def _get_data_client(conn):
+    """Return a cached DataClient for the given connection config."""
+    return _get_data_client_cached(json.dumps(conn, sort_keys=True))
 
 
 def get_aggregate_config(args, config_manager):
@@ -43,51 +110,47 @@ def get_aggregate_config(args, config_manager):
     Args:
         config_manager (ConfigManager): Validation config manager instance.
     """
-    aggregate_configs = [config_manager.build_config_count_aggregate()]
+    numeric_types = ["int64", "float64"]
+    aggregate_specs = (
+        ("count", args.count, None),
+        ("sum", args.sum, numeric_types),
+        ("avg", args.avg, numeric_types),
+        ("min", args.min, numeric_types),
+        ("max", args.max, numeric_types),
+    )
 
-    if args.count:
-        col_args = None if args.count == "*" else json.loads(args.count)
-        aggregate_configs += config_manager.build_config_column_aggregates(
-            "count", col_args, None
-        )
-    if args.sum:
-        col_args = None if args.sum == "*" else json.loads(args.sum)
-        aggregate_configs += config_manager.build_config_column_aggregates(
-            "sum", col_args, ["int64", "float64"]
-        )
-    if args.avg:
-        col_args = None if args.avg == "*" else json.loads(args.avg)
-        aggregate_configs += config_manager.build_config_column_aggregates(
-            "avg", col_args, ["int64", "float64"]
-        )
-    if args.min:
-        col_args = None if args.min == "*" else json.loads(args.min)
-        aggregate_configs += config_manager.build_config_column_aggregates(
-            "min", col_args, ["int64", "float64"]
-        )
-    if args.max:
-        col_args = None if args.max == "*" else json.loads(args.max)
+    aggregate_configs = [config_manager.build_config_count_aggregate()]
+    for agg_type, arg_value, supported_types in aggregate_specs:
+        if not arg_value:
+            continue
+        col_args = None if arg_value == "*" else json.loads(arg_value)
         aggregate_configs += config_manager.build_config_column_aggregates(
-            "max", col_args, ["int64", "float64"]
+            agg_type, col_args, supported_types
         )
 
     return aggregate_configs
 
 
-def build_config_from_args(args, config_manager):
+def build_config_from_args(
+    args, config_manager, grouped_columns=None, primary_keys=None
+):
     """Return config manager object ready to execute.
 
     Args:
         config_manager (ConfigManager): Validation config manager instance.
+        grouped_columns (list[str]): Decoded grouped columns, parsed from args if None.
+        primary_keys (list[str]): Decoded primary keys, parsed from args if None.
     """
     config_manager.append_aggregates(get_aggregate_config(args, config_manager))
-    if config_manager.validation_type in ["GroupedColumn", "Row"]:
-        grouped_columns = json.loads(args.grouped_columns)
+    if config_manager.validation_type in GROUPED_VALIDATION_TYPES:
+        if grouped_columns is None:
+            grouped_columns = json.loads(args.grouped_columns)
         config_manager.append_query_groups(
             config_manager.build_config_grouped_columns(grouped_columns)
         )
-    if config_manager.validation_type in ["Row"]:
-        primary_keys = json.loads(args.primary_keys or "[]")
+    if config_manager.validation_type in ROW_VALIDATION_TYPES:
+        if primary_keys is None:
+            primary_keys = json.loads(args.primary_keys or "[]")
         config_manager.append_primary_keys(
             config_manager.build_config_grouped_columns(primary_keys)
         )
@@ -109,22 +172,37 @@ def build_config_managers_from_args(args):
     if args.result_handler_config:
         result_handler_config = json.loads(args.result_handler_config)
 
-    source_client = DataValidation.get_data_client(source_conn)
-    target_client = DataValidation.get_data_client(target_conn)
+    source_client = _get_data_client(source_conn)
+    target_client = _get_data_client(target_conn)
+
+    # Config values shared by every table are only built once
+    base_config = ConfigManager.build_base_config(
+        config_type,
+        source_conn,
+        target_conn,
+        result_handler_config=result_handler_config,
+    )
+
+    # Decode the JSON arguments shared by every table once
+    grouped_columns = None
+    if args.grouped_columns:
+        grouped_columns = json.loads(args.grouped_columns)
+    primary_keys = json.loads(args.primary_keys or "[]")
 
     tables_list = json.loads(args.tables_list)
     for table_obj in tables_list:
-        config_manager = ConfigManager.build_config_manager(
-            config_type,
-            source_conn,
-            target_conn,
-            source_client,
-            target_client,
-            table_obj,
-            result_handler_config=result_handler_config,
-            verbose=args.verbose,
+        config = ConfigManager.build_table_config(base_config, table_obj)
+        config_manager = ConfigManager(
+            config, source_client, target_client, verbose=args.verbose
+        )
+        configs.append(
+            build_config_from_args(
+                args,
+                config_manager,
+                grouped_columns=grouped_columns,
+                primary_keys=primary_keys,
+            )
         )
-        configs.append(build_config_from_args(args, config_manager))
 
     return configs
 
@@ -139,13 +217,18 @@ def build_config_managers_from_yaml(args):
     source_conn = cli_tools.get_connection(yaml_configs[consts.YAML_SOURCE])
     target_conn = cli_tools.get_connection(yaml_configs[consts.YAML_TARGET])
 
-    source_client = DataValidation.get_data_client(source_conn)
-    target_client = DataValidation.get_data_client(target_conn)
+    source_client = _get_data_client(source_conn)
+    target_client = _get_data_client(target_conn)
+
+    source_conn_key = consts.CONFIG_SOURCE_CONN
+    target_conn_key = consts.CONFIG_TARGET_CONN
+    result_handler_key = consts.CONFIG_RESULT_HANDLER
+    result_handler_config = yaml_configs[consts.YAML_RESULT_HANDLER]
 
     for config in yaml_configs[consts.YAML_VALIDATIONS]:
-        config[consts.CONFIG_SOURCE_CONN] = source_conn
-        config[consts.CONFIG_TARGET_CONN] = target_conn
-        config[consts.CONFIG_RESULT_HANDLER] = yaml_configs[consts.YAML_RESULT_HANDLER]
+        config[source_conn_key] = source_conn
+        config[target_conn_key] = target_conn
+        config[result_handler_key] = result_handler_config
         config_manager = ConfigManager(
             config, source_client, target_client, verbose=args.verbose
         )
@@ -188,19 +271,37 @@ def run_validation(config_manager, verbose=False):
         validation_builder=None,
         result_handler=None,
         verbose=verbose,
+        source_client=config_manager.source_client,
+        target_client=config_manager.target_client,
     )
     validator.execute()
 
 
 def run_validations(args, config_managers):
-    """Run and manage a series of validations.
+    """Run and manage a series of validations in a thread pool.
 
     Args:
         config_managers (list[ConfigManager]): List of config manager instances.
     """
-    # TODO(issue/31): Add parallel execution logic
-    for config_manager in config_managers:
-        run_validation(config_manager, verbose=args.verbose)
+    if not config_managers:
+        return
+
+    max_workers = args.threads
+    if max_workers is None:
+        max_workers = min(DEFAULT_MAX_THREADS, len(config_managers))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(run_validation, config_manager, verbose=args.verbose)
+            for config_manager in config_managers
+        ]
+
+    # Log every failed validation before raising the first error.
+    errors = [future.exception() for future in futures]
+    errors = [error for error in errors if error is not None]
+    for error in errors:
+        logging.error(f"Validation failed: {error}")
+    if errors:
+        raise errors[0]
 
 
 def store_yaml_config_file(args, config_managers):
@@ -211,10 +312,20 @@ def store_yaml_config_file(args, config_managers):
     """
     config_file_path = _get_arg_config_file(args)
     yaml_configs = convert_config_to_yaml(args, config_managers)
-    yaml_config_str = dump(yaml_configs, Dumper=Dumper)
-
-    with open(config_file_path, "w") as yaml_file:
-        yaml_file.write(yaml_config_str)
+    # The document is dumped to memory rather than streamed to the file, as the
+    # full output is needed to compare it with the existing file before writing
+    yaml_config_bytes = dump(yaml_configs, Dumper=Dumper, encoding="utf-8")
+
+    # Leave an identical file untouched to keep its mtime and any caches valid
+    try:
+        with open(config_file_path, "rb") as yaml_file:
+            if yaml_file.read() == yaml_config_bytes:
+                return
+    except FileNotFoundError:
+        pass
+
+    with open(config_file_path, "wb") as yaml_file:
+        yaml_file.write(yaml_config_bytes)
 
 
 def run(args):
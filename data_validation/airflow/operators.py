@@ -79,6 +79,10 @@ class DataValidationCountOperator(BaseOperator):
         #                           for k, v in airflow_context_vars.items()]))
         # env.update(airflow_context_vars)
 
+        # TODO: this call does not match the DataValidation signature (config,
+        # validation_builder, result_handler) and raises a TypeError. Once it
+        # builds a full validation config, share clients across runs through
+        # the source_client and target_client arguments.
         builder = query_builder.QueryBuilder.build_count_validator()
         data_validator = data_validation.DataValidation(
             builder,
@@ -98,6 +98,7 @@ def _configure_run_config_parser(subparsers):
         "-c",
         help="YAML Config File Path to be used for building or running validations.",
     )
+    _add_threads_argument(run_config_parser)
 
 
 def _configure_run_parser(subparsers):
@@ -160,6 +161,26 @@ def _configure_run_parser(subparsers):
         "-c",
         help="Store the validation in the YAML Config File Path specified.",
     )
+    _add_threads_argument(run_parser)
+
+
+def _add_threads_argument(parser):
+    """Add the argument controlling how many validations run in parallel."""
+    parser.add_argument(
+        "--threads",
+        "-th",
+        type=_positive_int,
+        help="(Optional) Number of validations to run in parallel (default: up to 8)",
+    )
+
+
+def _positive_int(value):
+    """Return int value of an argument which must be 1 or greater."""
+    int_value = int(value)
+    if int_value < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+
+    return int_value
 
 
 def _configure_connection_parser(subparsers):
@@ -167,16 +167,44 @@ class ConfigManager(object):
 
         return self._target_ibis_table
 
-    def get_yaml_validation_block(self):
-        """Return Dict object formatted for a Yaml file."""
-        config = copy.deepcopy(self.config)
+    def get_source_compile_cache(self):
+        """Return Dict of compiled query fields for the source Ibis table."""
+        if not hasattr(self, "_source_compile_cache"):
+            self._source_compile_cache = {}
+
+        return self._source_compile_cache
+
+    def get_target_compile_cache(self):
+        """Return Dict of compiled query fields for the target Ibis table."""
+        if not hasattr(self, "_target_compile_cache"):
+            self._target_compile_cache = {}
+
+        return self._target_compile_cache
+
+    def get_source_column_types(self):
+        """Return Dict of source column names to their string type."""
+        if not hasattr(self, "_source_column_types"):
+            source_table = self.get_source_ibis_table()
+            self._source_column_types = {
+                column: str(source_table[column].type())
+                for column in source_table.columns
+            }
 
-        del config[consts.CONFIG_SOURCE_CONN]
-        del config[consts.CONFIG_TARGET_CONN]
-        if consts.CONFIG_RESULT_HANDLER in config:
-            del config[consts.CONFIG_RESULT_HANDLER]
+        return self._source_column_types
 
-        return config
+    def get_yaml_validation_block(self):
+        """Return Dict object formatted for a Yaml file."""
+        # Connection and result handler configs are dropped, so skip copying them
+        excluded_keys = (
+            consts.CONFIG_SOURCE_CONN,
+            consts.CONFIG_TARGET_CONN,
+            consts.CONFIG_RESULT_HANDLER,
+        )
+        return {
+            key: copy.deepcopy(value)
+            for key, value in self.config.items()
+            if key not in excluded_keys
+        }
 
     def get_result_handler(self):
         """Return ResultHandler instance from supplied config."""
@@ -202,6 +230,36 @@ class ConfigManager(object):
         else:
             raise ValueError(f"Unknown ResultHandler Class: {result_type}")
 
+    @staticmethod
+    def build_base_config(
+        config_type, source_conn, target_conn, result_handler_config=None
+    ):
+        """Return Dict config values shared by every table in a run."""
+        return {
+            consts.CONFIG_TYPE: config_type,
+            consts.CONFIG_SOURCE_CONN: source_conn,
+            consts.CONFIG_TARGET_CONN: target_conn,
+            consts.CONFIG_RESULT_HANDLER: result_handler_config,
+        }
+
+    @staticmethod
+    def build_table_config(base_config, table_obj):
+        """Return a copy of the base config with the table details added."""
+        schema_name = table_obj[consts.CONFIG_SCHEMA_NAME]
+        table_name = table_obj[consts.CONFIG_TABLE_NAME]
+
+        config = base_config.copy()
+        config[consts.CONFIG_SCHEMA_NAME] = schema_name
+        config[consts.CONFIG_TABLE_NAME] = table_name
+        config[consts.CONFIG_TARGET_SCHEMA_NAME] = table_obj.get(
+            consts.CONFIG_TARGET_SCHEMA_NAME, schema_name
+        )
+        config[consts.CONFIG_TARGET_TABLE_NAME] = table_obj.get(
+            consts.CONFIG_TARGET_TABLE_NAME, table_name
+        )
+
+        return config
+
     @staticmethod
     def build_config_manager(
         config_type,
@@ -214,20 +272,13 @@ class ConfigManager(object):
         verbose=False,
     ):
         """Return a ConfigManager instance with available config."""
-        config = {
-            consts.CONFIG_TYPE: config_type,
-            consts.CONFIG_SOURCE_CONN: source_conn,
-            consts.CONFIG_TARGET_CONN: target_conn,
-            consts.CONFIG_SCHEMA_NAME: table_obj[consts.CONFIG_SCHEMA_NAME],
-            consts.CONFIG_TABLE_NAME: table_obj[consts.CONFIG_TABLE_NAME],
-            consts.CONFIG_TARGET_SCHEMA_NAME: table_obj.get(
-                consts.CONFIG_TARGET_SCHEMA_NAME, table_obj[consts.CONFIG_SCHEMA_NAME]
-            ),
-            consts.CONFIG_TARGET_TABLE_NAME: table_obj.get(
-                consts.CONFIG_TARGET_TABLE_NAME, table_obj[consts.CONFIG_TABLE_NAME]
-            ),
-            consts.CONFIG_RESULT_HANDLER: result_handler_config,
-        }
+        base_config = ConfigManager.build_base_config(
+            config_type,
+            source_conn,
+            target_conn,
+            result_handler_config=result_handler_config,
+        )
+        config = ConfigManager.build_table_config(base_config, table_obj)
 
         return ConfigManager(config, source_client, target_client, verbose=verbose)
 
@@ -265,20 +316,18 @@ class ConfigManager(object):
         """Return list of aggregate objects of given agg_type."""
         aggregate_configs = []
         source_table = self.get_source_ibis_table()
-        target_table = self.get_target_ibis_table()
-        allowlist_columns = arg_value or source_table.columns
-        for column in source_table.columns:
+        column_types = self.get_source_column_types()
+        target_columns = set(self.get_target_ibis_table().columns)
+        allowlist_columns = set(arg_value or column_types)
+        for column, column_type in column_types.items():
             if column not in allowlist_columns:
                 continue
-            elif column not in target_table.columns:
+            elif column not in target_columns:
                 logging.info(
                     f"Skipping Agg {agg_type}: {source_table.op().name}.{column}"
                 )
                 continue
-            elif (
-                supported_types
-                and str(source_table[column].type()) not in supported_types
-            ):
+            elif supported_types and column_type not in supported_types:
                 continue
 
             aggregate_config = {
@@ -36,7 +36,13 @@ from data_validation.validation_builder import ValidationBuilder
 
 class DataValidation(object):
     def __init__(
-        self, config, validation_builder=None, result_handler=None, verbose=False
+        self,
+        config,
+        validation_builder=None,
+        result_handler=None,
+        verbose=False,
+        source_client=None,
+        target_client=None,
     ):
         """ Initialize a DataValidation client
 
@@ -45,18 +51,24 @@ class DataValidation(object):
             validation_builder (ValidationBuilder): Optional instance of a ValidationBuilder
             result_handler (ResultHandler): Optional instance of as ResultHandler client
             verbose (bool): If verbose, the Data Validation client will print the queries run
+            source_client (IbisClient): Optional existing client for the source connection
+            target_client (IbisClient): Optional existing client for the target connection
         """
         self.verbose = verbose
 
         # Data Client Management
         self.config = config
 
-        self.source_client = DataValidation.get_data_client(
-            self.config[consts.CONFIG_SOURCE_CONN]
-        )
-        self.target_client = DataValidation.get_data_client(
-            self.config[consts.CONFIG_TARGET_CONN]
-        )
+        self.source_client = source_client
+        if self.source_client is None:
+            self.source_client = DataValidation.get_data_client(
+                self.config[consts.CONFIG_SOURCE_CONN]
+            )
+        self.target_client = target_client
+        if self.target_client is None:
+            self.target_client = DataValidation.get_data_client(
+                self.config[consts.CONFIG_TARGET_CONN]
+            )
 
         self.config_manager = ConfigManager(
             config, self.source_client, self.target_client, verbose=self.verbose
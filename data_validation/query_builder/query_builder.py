@@ -13,10 +13,34 @@
 # limitations under the License.
 
 import ibis
+from ibis.expr.datatypes import Timestamp
 from third_party.ibis.ibis_addon import operations
 
 
+def _compile_cached(ibis_table, compile_cache, field_key, compile_func):
+    """ Return the compiled Ibis expression for a field, reusing prior results.
+
+    Args:
+        ibis_table (TableExpr): The Ibis table the field is compiled against
+        compile_cache (Dict): Compiled fields for this table keyed on field key,
+            or None to compile without caching
+        field_key (Tuple): A hashable key describing the field
+        compile_func (Callable): Builds the expression from the table on a miss
+    """
+    if compile_cache is None:
+        return compile_func(ibis_table)
+
+    compiled = compile_cache.get(field_key)
+    if compiled is None:
+        compiled = compile_func(ibis_table)
+        compile_cache[field_key] = compiled
+
+    return compiled
+
+
 class AggregateField(object):
+    __slots__ = ("expr", "field_name", "alias")
+
     def __init__(self, ibis_expr, field_name=None, alias=None):
         """ A representation of a table or column aggregate in Ibis
 
@@ -60,7 +84,11 @@ class AggregateField(object):
             ibis.expr.api.NumericColumn.sum, field_name=field_name, alias=alias,
         )
 
-    def compile(self, ibis_table):
+    def compile(self, ibis_table, compile_cache=None):
+        field_key = (AggregateField, self.expr, self.field_name, self.alias)
+        return _compile_cached(ibis_table, compile_cache, field_key, self._compile)
+
+    def _compile(self, ibis_table):
         if self.field_name:
             agg_field = self.expr(ibis_table[self.field_name])
         else:
@@ -73,6 +101,8 @@ class AggregateField(object):
 
 
 class FilterField(object):
+    __slots__ = ("expr", "left", "right", "left_field", "right_field")
+
     def __init__(
         self, ibis_expr, left=None, right=None, left_field=None, right_field=None
     ):
@@ -124,29 +154,44 @@ class FilterField(object):
         """
         return FilterField(None, left=expr)
 
-    def compile(self, ibis_table):
+    def compile(self, ibis_table, compile_cache=None):
+        # Raw SQL filters are cheap to build and are not cached
         if self.expr is None:
             return operations.compile_raw_sql(ibis_table, self.left)
 
+        field_key = (
+            FilterField,
+            self.expr,
+            self.left_field,
+            self.right_field,
+            None if self.left_field else (type(self.left), self.left),
+            None if self.right_field else (type(self.right), self.right),
+        )
+        try:
+            hash(field_key)
+        except TypeError:
+            return self._compile(ibis_table)
+
+        return _compile_cached(ibis_table, compile_cache, field_key, self._compile)
+
+    def _compile(self, ibis_table):
         if self.left_field:
             self.left = ibis_table[self.left_field]
             # Cast All Datetime to Date (TODO this may be a bug in BQ)
-            if isinstance(
-                ibis_table[self.left_field].type(), ibis.expr.datatypes.Timestamp
-            ):
+            if isinstance(self.left.type(), Timestamp):
                 self.left = self.left.cast("date")
         if self.right_field:
             self.right = ibis_table[self.right_field]
             # Cast All Datetime to Date (TODO this may be a bug in BQ)
-            if isinstance(
-                ibis_table[self.right_field].type(), ibis.expr.datatypes.Timestamp
-            ):
+            if isinstance(self.right.type(), Timestamp):
                 self.right = self.right.cast("date")
 
         return self.expr(self.left, self.right)
 
 
 class GroupedField(object):
+    __slots__ = ("field_name", "alias", "cast")
+
     def __init__(self, field_name, alias=None, cast=None):
         """ A representation of a group by field used to build a query.
 
@@ -159,14 +204,18 @@ class GroupedField(object):
         self.alias = alias
         self.cast = cast
 
-    def compile(self, ibis_table):
+    def compile(self, ibis_table, compile_cache=None):
+        field_key = (GroupedField, self.field_name, self.alias, self.cast)
+        return _compile_cached(ibis_table, compile_cache, field_key, self._compile)
+
+    def _compile(self, ibis_table):
         # Fields are supplied on compile or on build
         group_field = ibis_table[self.field_name]
 
         # TODO: generate cast for known types not specified
         if self.cast:
             group_field = group_field.cast(self.cast)
-        elif isinstance(group_field.type(), ibis.expr.datatypes.Timestamp):
+        elif isinstance(group_field.type(), Timestamp):
             group_field = group_field.cast("date")
         else:
             # TODO: need to build Truncation Int support
@@ -181,6 +230,8 @@ class GroupedField(object):
 
 
 class QueryBuilder(object):
+    __slots__ = ("aggregate_fields", "filters", "grouped_fields", "limit")
+
     def __init__(self, aggregate_fields, filters, grouped_fields, limit=None):
         """ Build a QueryBuilder object which can be used to build queries easily
 
@@ -209,40 +260,38 @@ class QueryBuilder(object):
             limit=limit,
         )
 
-    def compile_aggregate_fields(self, table):
-        aggs = [field.compile(table) for field in self.aggregate_fields]
-
-        return aggs
-
-    def compile_filter_fields(self, table):
-        return [field.compile(table) for field in self.filters]
-
-    def compile_group_fields(self, table):
-        return [field.compile(table) for field in self.grouped_fields]
-
-    def compile(self, data_client, schema_name, table_name):
+    def compile(
+        self, data_client, schema_name, table_name, ibis_table=None, compile_cache=None
+    ):
         """ Return an Ibis query object
 
         Args:
             data_client (IbisClient): The client used to validate the query.
             schema_name (String): The name of the schema for the given table.
             table_name (String): The name of the table to query.
+            ibis_table (TableExpr): An optional, already fetched Ibis table.
+            compile_cache (Dict): An optional cache of compiled fields owned
+                alongside ibis_table, reused by repeated compiles of that table.
         """
-        table = data_client.table(table_name, database=schema_name)
-
-        # Build Query Expressions
-        aggs = self.compile_aggregate_fields(table)
-        filters = self.compile_filter_fields(table)
-        groups = self.compile_group_fields(table)
-
-        query = table.filter(filters)
-        query = query.groupby(groups)
-        query = query.aggregate(aggs)
-
-        # if groups:
-        #     query = table.groupby(groups).aggregate(aggs)
-        # else:
-        #     query = table.aggregate(aggs)
+        if ibis_table is None:
+            table = data_client.table(table_name, database=schema_name)
+            compile_cache = None
+        else:
+            table = ibis_table
+
+        # Build Query Expressions, skipping empty filter and group by nodes
+        query = table
+        if self.filters:
+            query = query.filter(
+                [field.compile(table, compile_cache) for field in self.filters]
+            )
+        if self.grouped_fields:
+            query = query.groupby(
+                [field.compile(table, compile_cache) for field in self.grouped_fields]
+            )
+        query = query.aggregate(
+            [field.compile(table, compile_cache) for field in self.aggregate_fields]
+        )
 
         if self.limit:
             query = query.limit(self.limit)
@@ -21,6 +21,8 @@ from data_validation.query_builder.query_builder import (
     FilterField,
 )
 
+VALIDATION_TYPES = frozenset(("Column", "GroupedColumn", "Row"))
+
 
 class ValidationBuilder(object):
     def __init__(self, config_manager):
@@ -64,7 +66,7 @@ class ValidationBuilder(object):
     @staticmethod
     def get_query_builder(validation_type):
         """ Return Query Builder object given validation type """
-        if validation_type in ["Column", "GroupedColumn", "Row"]:
+        if validation_type in VALIDATION_TYPES:
             builder = QueryBuilder.build_count_validator()
         else:
             msg = "Validation Builder supplied unknown type: %s" % validation_type
@@ -207,6 +209,8 @@ class ValidationBuilder(object):
             "data_client": self.source_client,
             "schema_name": self.config_manager.source_schema,
             "table_name": self.config_manager.source_table,
+            "ibis_table": self.config_manager.get_source_ibis_table(),
+            "compile_cache": self.config_manager.get_source_compile_cache(),
         }
         query = self.source_builder.compile(**source_config)
         if self.verbose:
@@ -221,6 +225,8 @@ class ValidationBuilder(object):
             "data_client": self.target_client,
             "schema_name": self.config_manager.target_schema,
             "table_name": self.config_manager.target_table,
+            "ibis_table": self.config_manager.get_target_ibis_table(),
+            "compile_cache": self.config_manager.get_target_compile_cache(),
         }
         query = self.target_builder.compile(**target_config)
         if self.verbose:
@@ -13,6 +13,10 @@
 # limitations under the License.
 
 import argparse
+import logging
+import os
+import pytest
+from pyfakefs.fake_filesystem_unittest import patchfs
 from unittest import mock
 
 from data_validation import cli_tools
@@ -33,6 +37,12 @@ CLI_ARGS = {
 }
 
 
+def _create_file(file_path, contents):
+    """ Create a file through the patched filesystem """
+    with open(file_path, "w") as f:
+        f.write(contents)
+
+
 @mock.patch(
     "argparse.ArgumentParser.parse_args", return_value=argparse.Namespace(**CLI_ARGS),
 )
@@ -42,3 +52,103 @@ def test_configure_arg_parser(mock_args):
     file_path = main._get_arg_config_file(args)
 
     assert file_path == "example_test.yaml"
+
+
+@mock.patch("data_validation.data_validation.DataValidation.get_data_client")
+def test_get_data_client_cached(mock_get_data_client):
+    """Test equal connection configs reuse the same client."""
+    main._get_data_client_cached.cache_clear()
+    mock_get_data_client.side_effect = lambda conn: object()
+
+    client = main._get_data_client({"source_type": "Example", "project_id": "a"})
+    same_client = main._get_data_client({"project_id": "a", "source_type": "Example"})
+    other_client = main._get_data_client({"source_type": "Example", "project_id": "b"})
+
+    assert client is same_client
+    assert client is not other_client
+    assert mock_get_data_client.call_count == 2
+
+
+def test_get_aggregate_config():
+    """Test aggregate configs are built for each supplied aggregate arg."""
+    args = argparse.Namespace(
+        count="*", sum='["col_a"]', avg=None, min=None, max='["col_b"]'
+    )
+
+    def _column_aggregates(agg_type, col_args, supported_types):
+        return [(agg_type, col_args)]
+
+    config_manager = mock.Mock()
+    config_manager.build_config_count_aggregate.return_value = "count_star"
+    config_manager.build_config_column_aggregates.side_effect = _column_aggregates
+
+    aggregate_configs = main.get_aggregate_config(args, config_manager)
+
+    assert aggregate_configs == [
+        "count_star",
+        ("count", None),
+        ("sum", ["col_a"]),
+        ("max", ["col_b"]),
+    ]
+
+
+@patchfs
+def test_get_yaml_config_from_file_cached(fs):
+    """Test repeated yaml loads are cached and safe to mutate."""
+    _create_file("cached_test.yaml", "validations:\n- type: Column\n")
+    main._load_yaml_cached.cache_clear()
+
+    yaml_configs = main._get_yaml_config_from_file("cached_test.yaml")
+    yaml_configs["validations"][0]["type"] = "Row"
+    yaml_configs = main._get_yaml_config_from_file("cached_test.yaml")
+
+    assert yaml_configs["validations"][0]["type"] == "Column"
+    assert main._load_yaml_cached.cache_info().hits == 1
+
+
+@patchfs
+def test_get_yaml_config_from_json_file(fs):
+    """Test configs written as JSON or YAML flow style are both loaded."""
+    _create_file("json_test.yaml", '\n {"validations": [{"type": "Row"}]}')
+    _create_file("flow_test.yaml", "{validations: [{type: Row}]}")
+
+    json_configs = main._get_yaml_config_from_file("json_test.yaml")
+    flow_configs = main._get_yaml_config_from_file("flow_test.yaml")
+
+    assert json_configs == flow_configs == {"validations": [{"type": "Row"}]}
+
+
+@patchfs
+@mock.patch("data_validation.__main__.convert_config_to_yaml")
+def test_store_yaml_config_file_unchanged(mock_convert, fs):
+    """Test an identical yaml config file is not rewritten."""
+    mock_convert.return_value = {"validations": []}
+    args = argparse.Namespace(**CLI_ARGS)
+
+    main.store_yaml_config_file(args, [])
+    os.utime("example_test.yaml", ns=(0, 0))
+    main.store_yaml_config_file(args, [])
+
+    assert os.stat("example_test.yaml").st_mtime_ns == 0
+    with open("example_test.yaml") as yaml_file:
+        assert yaml_file.read() == "validations: []\n"
+
+
+@mock.patch("data_validation.__main__.run_validation")
+def test_run_validations_raises_first_error(mock_run_validation, caplog):
+    """Test every validation runs and each failure is logged before raising."""
+
+    def _run_validation(config_manager, verbose=False):
+        if config_manager != "ok":
+            raise ValueError(config_manager)
+
+    mock_run_validation.side_effect = _run_validation
+    args = argparse.Namespace(threads=2, verbose=False)
+
+    with caplog.at_level(logging.ERROR):
+        with pytest.raises(ValueError, match="first"):
+            main.run_validations(args, ["first", "ok", "second"])
+
+    assert mock_run_validation.call_count == 3
+    assert "Validation failed: first" in caplog.text
+    assert "Validation failed: second" in caplog.text
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import argparse
+import pytest
 from pyfakefs.fake_filesystem_unittest import patchfs
 from unittest import mock
 
@@ -62,6 +63,23 @@ def test_configure_arg_parser_list_connections():
     assert args.connect_cmd == "list"
 
 
+def test_configure_arg_parser_run_config_threads():
+    """Test parsing the number of validation threads."""
+    parser = cli_tools.configure_arg_parser()
+    args = parser.parse_args(["run-config", "-c", "example_test.yaml", "-th", "4"])
+
+    assert args.config_file == "example_test.yaml"
+    assert args.threads == 4
+
+
+def test_configure_arg_parser_rejects_non_positive_threads():
+    """Test thread counts below 1 are rejected."""
+    parser = cli_tools.configure_arg_parser()
+    for threads in ["0", "-2"]:
+        with pytest.raises(SystemExit):
+            parser.parse_args(["run-config", "-c", "example_test.yaml", "-th", threads])
+
+
 def test_get_connection_config_from_args():
     """Test configuring arg parse in different ways."""
     parser = cli_tools.configure_arg_parser()
@@ -175,6 +175,33 @@ def test_build_config_aggregates_no_match(module_under_test):
     assert not aggregate_configs
 
 
+def test_get_source_column_types(module_under_test):
+    config_manager = module_under_test.ConfigManager(
+        SAMPLE_CONFIG, MockIbisClient(), MockIbisClient(), verbose=False
+    )
+
+    column_types = config_manager.get_source_column_types()
+    assert column_types == {"a": "int64", "b": "int64", "c": "int64"}
+    assert config_manager.get_source_column_types() is column_types
+
+
+def test_build_table_config(module_under_test):
+    base_config = module_under_test.ConfigManager.build_base_config(
+        "Column", {"source_type": "a"}, {"source_type": "b"}
+    )
+    table_obj = {
+        consts.CONFIG_SCHEMA_NAME: "schema",
+        consts.CONFIG_TABLE_NAME: "table",
+        consts.CONFIG_TARGET_TABLE_NAME: "target_table",
+    }
+
+    config = module_under_test.ConfigManager.build_table_config(base_config, table_obj)
+    assert config[consts.CONFIG_TYPE] == "Column"
+    assert config[consts.CONFIG_TARGET_SCHEMA_NAME] == "schema"
+    assert config[consts.CONFIG_TARGET_TABLE_NAME] == "target_table"
+    assert consts.CONFIG_TABLE_NAME not in base_config
+
+
 def test_build_config_count_aggregate(module_under_test):
     config_manager = module_under_test.ConfigManager(
         SAMPLE_CONFIG, MockIbisClient(), MockIbisClient(), verbose=False
@@ -202,6 +229,17 @@ def test_get_yaml_validation_block(module_under_test):
     assert list(yaml_config.keys()) == expected_validation_keys
 
 
+def test_get_yaml_validation_block_copy(module_under_test):
+    config_manager = module_under_test.ConfigManager(
+        copy.deepcopy(SAMPLE_CONFIG), MockIbisClient(), MockIbisClient(), verbose=False
+    )
+    config_manager.append_aggregates([AGGREGATE_CONFIG_A])
+    yaml_config = config_manager.get_yaml_validation_block()
+    yaml_config[consts.CONFIG_AGGREGATES][0][consts.CONFIG_TYPE] = "Changed"
+
+    assert config_manager.aggregates[0][consts.CONFIG_TYPE] == "sum"
+
+
 def test_get_result_handler(module_under_test):
     config_manager = module_under_test.ConfigManager(
         SAMPLE_CONFIG, MockIbisClient(), MockIbisClient(), verbose=False
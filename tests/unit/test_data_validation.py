@@ -73,3 +73,15 @@ def test_data_validation_client(module_under_test, fs):
     """ Test getting a Data Validation Client """
     _create_table_file()
     module_under_test.DataValidation(SAMPLE_CONFIG)
+
+
+def test_data_validation_reuses_supplied_clients(module_under_test):
+    """ Test supplied clients are used instead of new connections """
+    source_client = object()
+    target_client = object()
+    client = module_under_test.DataValidation(
+        SAMPLE_CONFIG, source_client=source_client, target_client=target_client
+    )
+
+    assert client.source_client is source_client
+    assert client.target_client is target_client
@@ -0,0 +1,120 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import ibis.pandas
+import pandas
+import pytest
+
+
+TABLE_NAME = "my_table"
+TABLE_DF = pandas.DataFrame({"a": [1, 1, 2], "b": ["x", "y", "x"]})
+
+
+def _get_table():
+    """ Return a new Ibis table object over the same pandas data """
+    return ibis.pandas.connect({TABLE_NAME: TABLE_DF}).table(TABLE_NAME)
+
+
+class MockIbisClient(object):
+    def table(self, table_name, database=None):
+        return _get_table()
+
+
+@pytest.fixture
+def module_under_test():
+    from data_validation.query_builder import query_builder
+
+    return query_builder
+
+
+def test_aggregate_field_compile_cached(module_under_test):
+    table = _get_table()
+    compile_cache = {}
+    field = module_under_test.AggregateField.sum("a", alias="sum_a")
+
+    assert field.compile(table, compile_cache) is field.compile(table, compile_cache)
+    assert len(compile_cache) == 1
+
+
+def test_compile_without_cache(module_under_test):
+    table = _get_table()
+    field = module_under_test.GroupedField("b")
+
+    assert field.compile(table) is not field.compile(table)
+
+
+def test_filter_field_cache_keys_on_value_type(module_under_test):
+    table = _get_table()
+    compile_cache = {}
+    int_filter = module_under_test.FilterField.equal_to("a", 1)
+    float_filter = module_under_test.FilterField.equal_to("a", 1.0)
+
+    int_expr = int_filter.compile(table, compile_cache)
+    assert float_filter.compile(table, compile_cache) is not int_expr
+    assert len(compile_cache) == 2
+
+
+def test_filter_field_unhashable_value_not_cached(module_under_test):
+    def _compare(left, right):
+        return (left, right)
+
+    compile_cache = {}
+    filter_field = module_under_test.FilterField(_compare, left=["x"], right=1)
+
+    assert filter_field.compile(_get_table(), compile_cache) == (["x"], 1)
+    assert not compile_cache
+
+
+def test_query_builder_compile_reuses_cache(module_under_test):
+    table = _get_table()
+    compile_cache = {}
+    builder = module_under_test.QueryBuilder.build_count_validator()
+    builder.add_aggregate_field(
+        module_under_test.AggregateField.count("a", alias="count_a")
+    )
+
+    builder.compile(None, "my_schema", TABLE_NAME, ibis_table=table)
+    assert not compile_cache
+
+    builder.compile(
+        None, "my_schema", TABLE_NAME, ibis_table=table, compile_cache=compile_cache
+    )
+    assert len(compile_cache) == 1
+
+
+def test_query_builder_compile_count(module_under_test):
+    builder = module_under_test.QueryBuilder.build_count_validator()
+    builder.add_aggregate_field(
+        module_under_test.AggregateField.count("a", alias="count_a")
+    )
+
+    query = builder.compile(MockIbisClient(), "my_schema", TABLE_NAME)
+    result = query.execute()
+
+    assert result["count_a"].tolist() == [3]
+
+
+def test_query_builder_compile_filters_and_groups(module_under_test):
+    builder = module_under_test.QueryBuilder.build_count_validator()
+    builder.add_aggregate_field(
+        module_under_test.AggregateField.count("a", alias="count_a")
+    )
+    builder.add_filter_field(module_under_test.FilterField.equal_to("a", 1))
+    builder.add_grouped_field(module_under_test.GroupedField("b"))
+
+    query = builder.compile(None, "my_schema", TABLE_NAME, ibis_table=_get_table())
+    result = query.execute().sort_values("b")
+
+    assert result["b"].tolist() == ["x", "y"]
+    assert result["count_a"].tolist() == [1, 1]
@@ -1,13 +1,10 @@
 """BigQuery public API."""
 
-from typing import Optional
-
-import google.auth.credentials
-import google.cloud.bigquery  # noqa: F401, fail early if bigquery is missing
+import functools
+import threading
+from typing import TYPE_CHECKING, Optional
 
 import ibis.common.exceptions as com
-from client import TeradataClient  # TODO make non local
-from compiler import dialect  # TODO make non local
 from ibis.config import options  # noqa: F401
 
 try:
@@ -15,12 +12,85 @@ try:
 except ImportError:
     pass
 
+if TYPE_CHECKING:
+    from client import TeradataClient  # noqa: F401 # TODO make non local
+
 
 __all__ = ("compile", "connect", "verify", "udf")
 
+# Clients shared by connect(reuse_client=True), keyed on the connect arguments
+_client_pool = {}
+_client_pool_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_dialect():
+    """ Return the Teradata dialect, importing the compiler on first use """
+    from compiler import dialect  # TODO make non local
+
+    return dialect
+
+
+class _CompileKey:
+    """ Hashable wrapper keying an expression and its params by structure.
+
+    Two keys are equal when the expressions are structurally equal and the
+    params map the same parameters to the same values.
+    """
+
+    __slots__ = ("expr", "params", "_key", "_hash")
+
+    def __init__(self, expr, params):
+        self.expr = expr
+        self.params = params
+        params_key = frozenset(
+            (param._key, value) for param, value in (params or {}).items()
+        )
+        self._key = (expr._key, params_key)
+        self._hash = hash(self._key)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        return isinstance(other, _CompileKey) and self._key == other._key
+
+
+def _to_sql(expr, params):
+    from compiler import to_sql  # TODO make non local
+
+    return to_sql(expr, _get_dialect().make_context(params=params))
+
+
+def _try_compile(expr, params):
+    """ Return the SQL for the expression, or None if it can not be translated
+    Only the outcome is returned so no exception or traceback is kept alive.
+    """
+    try:
+        return _to_sql(expr, params)
+    except com.TranslationError:
+        return None
+
+
+@functools.lru_cache(maxsize=512)
+def _try_compile_cached(compile_key):
+    """ Compile the keyed expression, caching the SQL or None on failure """
+    return _try_compile(compile_key.expr, compile_key.params)
+
+
+def _compile_result(expr, params):
+    try:
+        compile_key = _CompileKey(expr, params)
+    except TypeError:
+        # Unhashable param values can not be cached
+        return _try_compile(expr, params)
+
+    return _try_compile_cached(compile_key)
+
 
 def compile(expr, params=None):
     """ Compile an expression for Teradata
+    Identical expressions and params are only translated once.
     Returns
     -------
     compiled : str
@@ -28,23 +98,28 @@ def compile(expr, params=None):
     --------
     ibis.expr.types.Expr.compile
     """
-    from compiler import to_sql  # TODO make non local
+    sql = _compile_result(expr, params)
+    if sql is None:
+        # Translate again uncached to raise the error with its own traceback
+        return _to_sql(expr, params)
 
-    return to_sql(expr, dialect.make_context(params=params))
+    return sql
 
 
 def verify(expr, params=None):
-    """ Check if an expression can be compiled using Teradata """
-    try:
-        compile(expr, params=params)
-        return True
-    except com.TranslationError:
-        return False
+    """ Check if an expression can be compiled using Teradata
+    The result is cached, so a following compile call does not translate again.
+    """
+    return _compile_result(expr, params) is not None
 
 
 def connect(
-    host: str, user_name: str, password: str, port: Optional[int] = 1025
-) -> TeradataClient:
+    host: str,
+    user_name: str,
+    password: str,
+    port: Optional[int] = 1025,
+    reuse_client: bool = False,
+) -> "TeradataClient":
     """ Create a TeradataClient for use with Ibis.
     Parameters
     ----------
@@ -56,9 +131,55 @@ def connect(
         Password for supplied username
     port : Optional[int]
         The database port to connect to (default. 1025)
+    reuse_client : bool
+        Return the client from an earlier call with the same arguments while
+        its session is alive (default. False). Pooled callers share one
+        session, including its default database and volatile tables.
     Returns
     -------
     TeradataClient
     """
+    import google.cloud.bigquery  # noqa: F401, fail before logon if bigquery is missing
+    from client import TeradataClient  # TODO make non local
 
-    return TeradataClient(host, user_name, password, port)
+    if not reuse_client:
+        return TeradataClient(host, user_name, password, port)
+
+    pool_key = (host, user_name, password, port)
+    with _client_pool_lock:
+        client = _client_pool.get(pool_key)
+    if client is not None:
+        if _is_client_alive(client):
+            return client
+        with _client_pool_lock:
+            # Only drop the stale client if another thread has not replaced it
+            if _client_pool.get(pool_key) is client:
+                del _client_pool[pool_key]
+        _close_client(client)
+
+    new_client = TeradataClient(host, user_name, password, port)
+    with _client_pool_lock:
+        client = _client_pool.setdefault(pool_key, new_client)
+    if client is not new_client:
+        # Another thread logged on first, share its client instead
+        _close_client(new_client)
+
+    return client
+
+
+def _close_client(client):
+    """ Close a stale pooled client, ignoring errors from a dead session """
+    try:
+        client.client.close()
+    except Exception:
+        pass
+
+
+def _is_client_alive(client) -> bool:
+    """ Check a pooled client's session still answers queries """
+    try:
+        with client.client.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        return True
+    except Exception:
+        return False